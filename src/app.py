@@ -13,6 +13,7 @@ import _unit_router
 import _workbench_router
 from _logging import HANDLERS
 from feecc_workbench.database import MongoDbWrapper
+from feecc_workbench.ipfs import close_ipfs_client
 from feecc_workbench.Messenger import MessageLevels, message_generator, messenger
 from feecc_workbench.models import GenericResponse
 from feecc_workbench.utils import check_service_connectivity
@@ -54,6 +55,7 @@ def startup_event() -> None:
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     await WorkBench().shutdown()
+    await close_ipfs_client()
     MongoDbWrapper().close_connection()
 
 
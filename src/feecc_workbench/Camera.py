@@ -1,5 +1,10 @@
 import asyncio
-import os
+import contextlib
+import functools
+import pathlib
+import shlex
+import sys
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import uuid4
@@ -12,6 +17,42 @@ import re
 from .translation import translation
 
 MINIMAL_RECORD_DURATION_SEC: int = 3
+VIDEO_DIR = pathlib.Path("output/video")
+FFMPEG_OUTPUT_TAIL_LINES: int = 20
+FFMPEG_OUTPUT_CHUNK_SIZE: int = 4096
+FFMPEG_OUTPUT_LINE_SEPARATOR: re.Pattern[bytes] = re.compile(rb"[\r\n]")
+CAMERA_ADDRESS_PATTERN: re.Pattern[str] = re.compile(r"@[\w._+-]+:\d{1,5}")
+
+
+def _parse_ffmpeg_command() -> list[str]:
+    """split the ffmpeg command into arguments. It is executed without a shell, so no shell syntax is supported"""
+    if not CONFIG.camera.enable:
+        return []
+
+    try:
+        command = shlex.split(CONFIG.camera.ffmpeg_command)
+    except ValueError as e:
+        logger.critical(f"Failed to parse CAMERA_FFMPEG_COMMAND: {e}. Exiting.")
+        sys.exit(1)
+
+    if not command:
+        logger.critical("Camera is enabled, but CAMERA_FFMPEG_COMMAND is empty. Exiting.")
+        sys.exit(1)
+
+    return command
+
+
+# the command template doesn't change at runtime, so it is only tokenized once
+FFMPEG_COMMAND: list[str] = _parse_ffmpeg_command()
+
+
+@functools.cache
+def _get_camera_address() -> tuple[str, int]:
+    """parse camera host and port out of the ffmpeg command"""
+    match = CAMERA_ADDRESS_PATTERN.search(CONFIG.camera.ffmpeg_command)
+    assert match is not None, "No camera address found in the ffmpeg command"
+    addr, port = match[0].split(":")
+    return addr[1:], int(port)
 
 
 @dataclass
@@ -23,6 +64,8 @@ class Record:
     record_id: str = field(default_factory=lambda: uuid4().hex)
     start_time: datetime | None = None
     end_time: datetime | None = None
+    ffmpeg_output_tail: deque[str] = field(default_factory=lambda: deque(maxlen=FFMPEG_OUTPUT_TAIL_LINES))
+    _output_reader: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.filename = self._get_video_filename()
@@ -39,11 +82,9 @@ class Record:
 
         return int(duration.total_seconds())
 
-    def _get_video_filename(self, dir_: str = "output/video") -> str:
+    def _get_video_filename(self) -> str:
         """determine a valid video name not to override an existing video"""
-        if not os.path.isdir(dir_):
-            os.makedirs(dir_)
-        return f"{dir_}/{self.record_id}.mp4"
+        return str(VIDEO_DIR / f"{self.record_id}.mp4")
 
     @property
     def is_ongoing(self) -> bool:
@@ -57,18 +98,38 @@ class Record:
         """Execute ffmpeg command"""
         # ffmpeg -loglevel warning -rtsp_transport tcp -i "rtsp://login:password@ip:port/Streaming/Channels/101" \
         # -c copy -map 0 vid.mp4
-        command = CONFIG.camera.ffmpeg_command
-        command = command.replace("FILENAME", str(self.filename), 1)
+        # the command is executed directly rather than through /bin/sh, so filenames need no shell escaping
+        command = [arg.replace("FILENAME", str(self.filename), 1) for arg in FFMPEG_COMMAND]
 
-        self.process_ffmpeg = await asyncio.subprocess.create_subprocess_shell(
-            cmd=command,
-            stdout=asyncio.subprocess.PIPE,
+        self.process_ffmpeg = await asyncio.subprocess.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
             stdin=asyncio.subprocess.PIPE,
         )
+        # ffmpeg writes to stderr throughout the recording and would block once the pipe buffer fills up
+        self._output_reader = asyncio.create_task(self._read_output(self.process_ffmpeg))
         self.start_time = datetime.now()
         logger.info(f"Started recording video '{self.filename}' using ffmpeg. {self.process_ffmpeg.pid=}")
 
+    def _store_output_line(self, line: bytes) -> None:
+        if line := line.strip():
+            self.ffmpeg_output_tail.append(line.decode(errors="replace"))
+
+    async def _read_output(self, process: asyncio.subprocess.Process) -> None:
+        """drain ffmpeg stderr, keeping only the last lines for diagnostics"""
+        assert process.stderr is not None
+        pending = b""
+
+        # ffmpeg ends progress lines with '\r', so output is read in chunks rather than with readline
+        while chunk := await process.stderr.read(FFMPEG_OUTPUT_CHUNK_SIZE):
+            *lines, pending = FFMPEG_OUTPUT_LINE_SEPARATOR.split(pending + chunk)
+            for line in lines:
+                self._store_output_line(line)
+            pending = pending[-FFMPEG_OUTPUT_CHUNK_SIZE:]
+
+        self._store_output_line(pending)
+
     @logger.catch(reraise=True)
     async def stop(self) -> None:
         """stop recording a video"""
@@ -86,15 +147,29 @@ class Record:
 
         logger.info(f"Trying to stop record {self.record_id} process {self.process_ffmpeg.pid=}")
 
-        stdout, stderr = await self.process_ffmpeg.communicate(input=b"q")
-        await self.process_ffmpeg.wait()
-        return_code = self.process_ffmpeg.returncode
+        stdin = self.process_ffmpeg.stdin
+        assert stdin is not None
+
+        # ffmpeg may have already exited on its own
+        with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+            stdin.write(b"q")
+            await stdin.drain()
+            stdin.close()
+
+        return_code = await self.process_ffmpeg.wait()
+
+        if self._output_reader is not None:
+            try:
+                await self._output_reader
+            except Exception as e:
+                logger.warning(f"Failed to read ffmpeg output for record {self.record_id}: {e}")
+            self._output_reader = None
 
         if return_code == 0:
             logger.debug("Got a zero return code from ffmpeg subprocess. Assuming success.")
         else:
             logger.error(f"Got a non zero return code from ffmpeg subprocess: {return_code}")
-            logger.debug(f"{stdout=} {stderr=}")
+            logger.debug(f"ffmpeg output: {list(self.ffmpeg_output_tail)}")
 
         self.process_ffmpeg = None
         self.end_time = datetime.now()
@@ -107,17 +182,16 @@ class Camera:
 
     def __init__(self) -> None:
         self.record: Record | None = None
+        VIDEO_DIR.mkdir(parents=True, exist_ok=True)
         self._is_up()
 
     @staticmethod
     def _is_up() -> bool:
         """Check if camera is connected to the workbench computer"""
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.settimeout(0.25)
-            pattern: re.Pattern = re.compile(r'@[\w._+-]+:\d{1,5}')
-            addr, port = pattern.search(CONFIG.camera.ffmpeg_command)[0].split(":")
-            s.connect((addr[1:], int(port)))
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.settimeout(0.25)
+                s.connect(_get_camera_address())
             logger.debug("Camera is up")
             return True
         except Exception as e:
@@ -14,9 +14,9 @@ from .ipfs import publish_file
 from .Messenger import messenger
 from .metrics import metrics
 from .models import ProductionSchema
-from .passport_generator import construct_unit_passport
+from .passport_generator import construct_unit_passport, get_passport_path, save_unit_passport
 from .printer import print_image
-from .robonomics import post_to_datalog
+from .robonomics import DatalogPublisher, get_posted_txn_hash
 from .Singleton import SingletonMeta
 from .states import STATE_TRANSITION_MAP, State
 from .translation import translation
@@ -43,6 +43,14 @@ class WorkBench(metaclass=SingletonMeta):
         self.unit: Unit | None = None
         self.state: State = State.AWAIT_LOGIN_STATE
 
+        # config is frozen, so feature flags are resolved once
+        self._ipfs_enabled: bool = CONFIG.ipfs_gateway.enable
+        self._datalog_enabled: bool = CONFIG.robonomics.enable_datalog
+        self._print_barcode_enabled: bool = CONFIG.printer.print_barcode and CONFIG.printer.enable
+        self._print_qr_enabled: bool = CONFIG.printer.print_qr
+        self._print_qr_only_for_composite: bool = CONFIG.printer.print_qr_only_for_composite
+        self._print_security_tag_enabled: bool = CONFIG.printer.print_security_tag
+
         logger.info(f"Workbench {self.number} was initialized")
 
     async def _print_unit_barcode(self, unit: Unit) -> None:
@@ -69,7 +77,7 @@ class WorkBench(metaclass=SingletonMeta):
             messenger.error(translation('AuthorizedState'))
             raise StateForbiddenError(message)
         unit = Unit(schema)
-        if CONFIG.printer.print_barcode and CONFIG.printer.enable:
+        if self._print_barcode_enabled:
             await self._print_unit_barcode(unit)
         await self._database.push_unit(unit)
         metrics.register_create_unit(self.employee, unit)
@@ -221,17 +229,15 @@ class WorkBench(metaclass=SingletonMeta):
             messenger.warning(translation('NotSaveVideo'))
             file = None
 
-        if file is not None:
+        if file is not None and self._ipfs_enabled:
             try:
-                data = await publish_file(file_path=Path(file), rfid_card_id=self.employee.rfid_card_id)
-
-                if data is not None:
-                    cid, link = data
-                    ipfs_hashes.append(cid)
+                cid, _ = await publish_file(file_path=Path(file), rfid_card_id=self.employee.rfid_card_id)
+                ipfs_hashes.append(cid)
             except Exception as e:
                 logger.error(f"Failed to publish record: {e}")
                 messenger.warning(translation('SaveLocalVideo'))
-                ipfs_hashes = []
+        elif file is not None:
+            logger.info(f"IPFS gateway is disabled, record saved locally as '{file}'")
 
         return ipfs_hashes, override_timestamp
 
@@ -314,19 +320,29 @@ class WorkBench(metaclass=SingletonMeta):
             messenger.error(translation('NecessaryAuth'))
             raise AssertionError("No employee is logged in at the workbench")
 
-        # Generate and save passport YAML file
-        passport_file_path: Path = await construct_unit_passport(self.unit)
+        # Generate passport YAML file contents
+        passport: bytes = await construct_unit_passport(self.unit)
 
         # Determine if QR-code has to be printed -> short link is needed right now
-        print_qr = CONFIG.printer.print_qr and (
-            not CONFIG.printer.print_qr_only_for_composite
+        print_qr = self._print_qr_enabled and (
+            not self._print_qr_only_for_composite
             or self.unit.schema.is_composite
             or not self.unit.schema.is_a_component
         )
 
-        # Publish passport YAML file into IPFS
-        if CONFIG.ipfs_gateway.enable:
-            cid, link = await publish_file(file_path=passport_file_path, rfid_card_id=self.employee.rfid_card_id)
+        # Publish passport YAML file into IPFS straight from memory. It is only saved locally
+        # if it cannot be published, so that the passport data is never lost.
+        if self._ipfs_enabled:
+            try:
+                cid, link = await publish_file(
+                    file_path=get_passport_path(self.unit),
+                    rfid_card_id=self.employee.rfid_card_id,
+                    file_data=passport,
+                )
+            except Exception as e:
+                save_unit_passport(self.unit, passport)
+                raise e
+
             self.unit.passport_ipfs_cid = cid
 
             # Generate a QR-code pointing to the unit's passport and print it
@@ -337,14 +353,20 @@ class WorkBench(metaclass=SingletonMeta):
                     messenger.error(translation('CanceledPasport'))
                     logger.error(f"Failed to print QR code. Passport not saved. {e}")
                     raise e
+        else:
+            save_unit_passport(self.unit, passport)
 
         # Print a security tag sticker if needed
-        if CONFIG.printer.print_security_tag:
+        if self._print_security_tag_enabled:
             await self._print_security_tag()
 
         # Publish passport file's IPFS CID to Robonomics Datalog
-        if CONFIG.robonomics.enable_datalog and (cid := self.unit.passport_ipfs_cid) is not None:
-            asyncio.create_task(post_to_datalog(cid, self.unit.internal_id))
+        if self._datalog_enabled and (cid := self.unit.passport_ipfs_cid) is not None:
+            # already posted data is not posted again, pushing the unit below saves the earlier transaction hash
+            if (txn_hash := get_posted_txn_hash(cid, self.unit.internal_id)) is not None:
+                self.unit.txn_hash = txn_hash
+            else:
+                await DatalogPublisher().enqueue(cid, self.unit.internal_id)
 
         # Update unit data saved in the DB
         await self._database.push_unit(self.unit)
@@ -369,6 +391,8 @@ class WorkBench(metaclass=SingletonMeta):
         if self.state == State.AUTHORIZED_IDLING_STATE:
             self.log_out()
 
+        await DatalogPublisher().shutdown()
+
         message = "Workbench shutdown sequence complete"
         logger.info(message)
         messenger.success(translation('FinishServer'))
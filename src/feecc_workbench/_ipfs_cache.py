@@ -0,0 +1,40 @@
+import datetime as dt
+import json
+import pathlib
+
+from loguru import logger
+
+# publications are stored by the SHA-256 digest of the published contents, sharded by the first two hex digits
+CACHE_DIR = pathlib.Path("output/ipfs_cache")
+
+
+def _get_record_path(digest: str) -> pathlib.Path:
+    return CACHE_DIR / digest[:2] / f"{digest[2:]}.json"
+
+
+def get_cached_publication(digest: str) -> tuple[str, str] | None:
+    """get CID and URL of an already published file with the provided digest, if any"""
+    record_path = _get_record_path(digest)
+    if not record_path.exists():
+        return None
+
+    try:
+        with record_path.open("r") as f:
+            record = json.load(f)
+        return record["ipfs_cid"], record["ipfs_link"]
+    except Exception as e:
+        logger.warning(f"Failed to read IPFS cache record {record_path}: {e}")
+        return None
+
+
+def cache_publication(digest: str, cid: str, link: str) -> None:
+    """save CID and URL of a published file with the provided digest"""
+    record_path = _get_record_path(digest)
+    record = {"ipfs_cid": cid, "ipfs_link": link, "timestamp": dt.datetime.now().isoformat()}
+
+    try:
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        with record_path.open("w") as f:
+            json.dump(record, f)
+    except Exception as e:
+        logger.warning(f"Failed to save IPFS cache record {record_path}: {e}")
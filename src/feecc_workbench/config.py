@@ -33,6 +33,9 @@ class AppConfig:
     class IPFSGateway:
         enable: bool = environ.bool_var(default=False, help="Whether to enable IPFS posting or not")
         ipfs_server_uri: str = environ.var(default="http://127.0.0.1:8083", help="Your IPFS gateway deployment URI")
+        publish_by_path: bool = environ.bool_var(
+            default=False, help="Whether to let the IPFS gateway read local files by path instead of uploading them"
+        )
 
     @environ.config(frozen=True)
     class Printer:
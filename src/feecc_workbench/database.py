@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import asdict
 from typing import Any
 
@@ -15,7 +16,7 @@ from .ProductionStage import ProductionStage
 from .Singleton import SingletonMeta
 from .Types import BulkWriteTask, Document
 from .Unit import Unit
-from .unit_utils import UnitStatus
+from .unit_utils import UnitStatus, _get_unit_list
 from .utils import async_time_execution
 
 
@@ -57,23 +58,39 @@ class MongoDbWrapper(metaclass=SingletonMeta):
 
             tasks.append(task)
 
+        if not tasks:
+            return
+
         result = await self._prod_stage_collection.bulk_write(tasks)
         logger.debug(f"Bulk write operation result: {result.bulk_api_result}")
 
+    async def _bulk_push_units(self, units: list[Unit]) -> None:
+        tasks: list[BulkWriteTask] = []
+
+        for unit in units:
+            unit_dict = _get_unit_dict_data(unit)
+
+            if unit.is_in_db:
+                task: BulkWriteTask = UpdateOne({"uuid": unit.uuid}, {"$set": unit_dict})
+            else:
+                task = InsertOne(unit_dict)
+
+            tasks.append(task)
+
+        result = await self._unit_collection.bulk_write(tasks)
+        logger.debug(f"Bulk write operation result: {result.bulk_api_result}")
+
     @async_time_execution
     async def push_unit(self, unit: Unit, include_components: bool = True) -> None:
-        """Upload or update data about the unit into the DB"""
-        if unit.components_units and include_components:
-            for component in unit.components_units:
-                await self.push_unit(component)
-
-        await self._bulk_push_production_stages(unit.biography)
-        unit_dict = _get_unit_dict_data(unit)
-
-        if unit.is_in_db:
-            await self._unit_collection.find_one_and_update({"uuid": unit.uuid}, {"$set": unit_dict})
-        else:
-            await self._unit_collection.insert_one(unit_dict)
+        """Upload or update data about the unit (and its components) into the DB"""
+        # the whole component tree is written with a single bulk request per collection
+        units: list[Unit] = _get_unit_list(unit) if include_components else [unit]
+        production_stages: list[ProductionStage] = [stage for unit_ in units for stage in unit_.biography]
+
+        await asyncio.gather(
+            self._bulk_push_production_stages(production_stages),
+            self._bulk_push_units(units),
+        )
 
     @async_time_execution
     async def unit_update_single_field(self, unit_internal_id: str, field_name: str, field_val: Any) -> None:
@@ -1,52 +1,113 @@
+import asyncio
+import hashlib
 import pathlib
-import os
 
 import httpx
 from loguru import logger
 
+from ._ipfs_cache import cache_publication, get_cached_publication
 from .config import CONFIG
 from .Messenger import messenger
 from .translation import translation
 from .utils import async_time_execution, get_headers, service_is_up
 
 IPFS_GATEWAY_ADDRESS: str = CONFIG.ipfs_gateway.ipfs_server_uri
+IPFS_GATEWAY_CONNECTION_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8, keepalive_expiry=60)
+# httpx reads multipart file bodies in small chunks, a large buffer saves most of the read syscalls on big videos
+UPLOAD_READ_BUFFER_SIZE: int = 1 << 20
 
+_ipfs_client: httpx.AsyncClient | None = None
 
-@async_time_execution
-async def publish_file(rfid_card_id: str, file_path: pathlib.Path) -> tuple[str, str]:
-    """publish a provided file to IPFS using the Feecc gateway and return it's CID and URL"""
-    if not CONFIG.ipfs_gateway.enable:
-        raise ValueError("IPFS Gateway disabled in config")
 
-    if not service_is_up(IPFS_GATEWAY_ADDRESS):
+def _get_ipfs_client() -> httpx.AsyncClient:
+    """get a shared IPFS gateway client, so that connections are kept alive and reused between uploads"""
+    global _ipfs_client
+    if _ipfs_client is None or _ipfs_client.is_closed:
+        _ipfs_client = httpx.AsyncClient(
+            base_url=f"{IPFS_GATEWAY_ADDRESS}/publish-to-ipfs",
+            limits=IPFS_GATEWAY_CONNECTION_LIMITS,
+            timeout=None,
+        )
+    return _ipfs_client
+
+
+async def close_ipfs_client() -> None:
+    """close the shared IPFS gateway client and its connections"""
+    if _ipfs_client is not None and not _ipfs_client.is_closed:
+        await _ipfs_client.aclose()
+        logger.info("IPFS gateway client closed")
+
+
+async def _upload(rfid_card_id: str, file_path: pathlib.Path, file_data: bytes | None) -> tuple[str, str]:
+    """send the file to the Feecc gateway and return it's CID and URL"""
+    if not await asyncio.to_thread(service_is_up, IPFS_GATEWAY_ADDRESS):
         message = "IPFS gateway is not available"
         messenger.error(translation('IPFSunavailable'))
         raise ConnectionError(message)
 
-    file_path = pathlib.Path(file_path)
     headers: dict[str, str] = get_headers(rfid_card_id)
-    base_url = f"{IPFS_GATEWAY_ADDRESS}/publish-to-ipfs"
+    client = _get_ipfs_client()
+
+    if file_data is not None:
+        file_field = {"file_data": (file_path.name, file_data)}
+        response: httpx.Response = await client.post(url="/upload-file", headers=headers, files=file_field)
+    elif file_path.exists() and not CONFIG.ipfs_gateway.publish_by_path:
+        with file_path.open("rb", buffering=UPLOAD_READ_BUFFER_SIZE) as f:
+            files = {"file_data": f}
+            response = await client.post(url="/upload-file", headers=headers, files=files)
+    else:
+        # the gateway reads the file itself: either it's stored on the gateway host or the storage is shared
+        absolute_path = file_path.absolute() if file_path.exists() else file_path
+        json = {"absolute_path": str(absolute_path)}
+        response = await client.post(url="/by-path", headers=headers, json=json)
 
-    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
-        if file_path.exists():
-            with file_path.open("rb") as f:
-                files = {"file_data": f}
-                response: httpx.Response = await client.post(url="/upload-file", headers=headers, files=files)
-        else:
-            json = {"absolute_path": str(file_path)}
-            response = await client.post(url="/by-path", headers=headers, json=json)
+    response_data = response.json()
 
     if response.is_error:
-        messenger.error(translation('ErrorIPFS') +" "+ response.json().get('detail', ''))
-        raise httpx.RequestError(response.json().get("detail", ""))
+        messenger.error(translation('ErrorIPFS') +" "+ response_data.get('detail', ''))
+        raise httpx.RequestError(response_data.get("detail", ""))
 
-    assert int(response.json().get("status", 500)) == 200, response.json()
+    assert int(response_data.get("status", 500)) == 200, response_data
 
-    cid: str = response.json().get("ipfs_cid")
-    link: str = response.json().get("ipfs_link")
+    cid: str = response_data.get("ipfs_cid")
+    link: str = response_data.get("ipfs_link")
     assert cid and link, "IPFS gateway returned no CID"
-    if file_path.exists():
-        os.remove(file_path)
+
+    return cid, link
+
+
+@async_time_execution
+async def publish_file(
+    rfid_card_id: str, file_path: pathlib.Path, file_data: bytes | None = None
+) -> tuple[str, str]:
+    """
+    publish a provided file to IPFS using the Feecc gateway and return it's CID and URL
+
+    If file_data is provided, it is uploaded as the file contents directly, so the file
+    does not have to be written to the disk and read back just to be published.
+
+    Contents provided as file_data that have already been published from this workbench
+    are not uploaded again.
+    """
+    if not CONFIG.ipfs_gateway.enable:
+        raise ValueError("IPFS Gateway disabled in config")
+
+    file_path = pathlib.Path(file_path)
+
+    # files on disk are removed once published, so only in-memory contents (passports) can ever be republished
+    digest: str | None = hashlib.sha256(file_data).hexdigest() if file_data is not None else None
+
+    if digest is not None and (cached := get_cached_publication(digest)) is not None:
+        cid, link = cached
+        logger.info(f"File '{file_path}' has already been published to IPFS under CID {cid}. Upload skipped.")
+    else:
+        cid, link = await _upload(rfid_card_id, file_path, file_data)
+        if digest is not None:
+            cache_publication(digest, cid, link)
+
+    if file_data is None and file_path.exists():
+        # freeing the extents of a large video is slow on eMMC/SD storage, so the event loop shouldn't wait for it
+        await asyncio.to_thread(file_path.unlink)
     logger.info(f"File '{file_path} published to IPFS under CID {cid}'")
 
     return cid, link
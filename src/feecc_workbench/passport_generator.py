@@ -68,21 +68,31 @@ def _get_passport_dict(unit: Unit) -> dict[str, Any]:
     return passport_dict
 
 
-def _save_passport(unit: Unit, passport_dict: dict[str, Any], path: str) -> None:
-    """makes a unit passport and dumps it in a form of a YAML file"""
-    dir_ = pathlib.Path("unit-passports")
+def _save_passport(unit: Unit, passport: bytes, path: pathlib.Path) -> None:
+    """dumps a serialized unit passport in a form of a YAML file"""
+    dir_ = path.parent
     if not dir_.is_dir():
         dir_.mkdir()
-    passport_file = pathlib.Path(path)
-    with passport_file.open("w") as f:
-        yaml.dump(passport_dict, f, allow_unicode=True, sort_keys=False)
+    path.write_bytes(passport)
     logger.info(f"Unit passport with UUID {unit.uuid} has been dumped successfully")
 
 
+def get_passport_path(unit: Unit) -> pathlib.Path:
+    """get a path to the unit passport file"""
+    return pathlib.Path(f"unit-passports/unit-passport-{unit.uuid}.yaml")
+
+
+@logger.catch(reraise=True)
+async def construct_unit_passport(unit: Unit) -> bytes:
+    """construct own passport and return it serialized as YAML"""
+    passport_dict = _get_passport_dict(unit)
+    passport: str = yaml.dump(passport_dict, allow_unicode=True, sort_keys=False)
+    return passport.encode()
+
+
 @logger.catch(reraise=True)
-async def construct_unit_passport(unit: Unit) -> pathlib.Path:
-    """construct own passport, dump it as .yaml file and return a path to it"""
-    passport = _get_passport_dict(unit)
-    path = f"unit-passports/unit-passport-{unit.uuid}.yaml"
+def save_unit_passport(unit: Unit, passport: bytes) -> pathlib.Path:
+    """dump the serialized passport as .yaml file and return a path to it"""
+    path = get_passport_path(unit)
     _save_passport(unit, passport, path)
-    return pathlib.Path(path)
+    return path
@@ -1,4 +1,4 @@
-import os
+import functools
 import textwrap
 from pathlib import Path
 from statistics import mean
@@ -15,6 +15,9 @@ from .translation import translation
 from .utils import async_time_execution
 from ._label_generation import _resize_to_paper_aspect_ratio
 
+ANNOTATION_FONT_PATH = Path("media/helvetica-cyrillic-bold.ttf")
+ANNOTATION_FONT_SIZE: int = 35
+
 
 async def print_image(file_path: Path, annotation: str | None = None) -> None:
     """print the provided image file"""
@@ -54,13 +57,19 @@ async def _print_image_task(file_path: Path) -> None:
         messenger.error(translation('PrintError'))
 
 
+@functools.cache
+def _get_annotation_font() -> tuple[FreeTypeFont, float]:
+    """load the annotation font once and measure its average character width"""
+    assert ANNOTATION_FONT_PATH.is_file(), f"Cannot open font at {ANNOTATION_FONT_PATH=}. No such file."
+    font: FreeTypeFont = ImageFont.truetype(str(ANNOTATION_FONT_PATH), ANNOTATION_FONT_SIZE)
+    avg_char_width: float = mean(font.getsize(char)[0] for char in ascii_letters)
+    return font, avg_char_width
+
+
 def _annotate_image(image: Image, text: str) -> Image:
     """add an annotation to the bottom of the image"""
     # wrap the message
-    font_path = "media/helvetica-cyrillic-bold.ttf"
-    assert os.path.exists(font_path), f"Cannot open font at {font_path=}. No such file."
-    font: FreeTypeFont = ImageFont.truetype(font_path, 35)
-    avg_char_width: float = mean((font.getsize(char)[0] for char in ascii_letters))
+    font, avg_char_width = _get_annotation_font()
     img_w, img_h = image.size
     logger.debug(f"Image size before annotation: {img_w, img_h}")
     max_chars_in_line: int = int(img_w * 0.95 / avg_char_width)
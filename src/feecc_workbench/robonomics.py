@@ -1,4 +1,7 @@
 import asyncio
+import contextlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from loguru import logger
 from robonomicsinterface import Account, Datalog
@@ -7,10 +10,17 @@ from .config import CONFIG
 from .database import MongoDbWrapper
 from .exceptions import RobonomicsError
 from .Messenger import messenger
+from .Singleton import SingletonMeta
 from .utils import async_time_execution
 from .translation import translation
 
 
+DATALOG_SHUTDOWN_TIMEOUT_SEC: float = 30
+
+# records are serialized by the client lock anyway, so a single dedicated thread is enough
+_DATALOG_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="datalog")
+
+
 class AsyncDatalogClient(Datalog):  # type: ignore
     """Async thread safe Datalog client implementation"""
 
@@ -20,35 +30,60 @@ class AsyncDatalogClient(Datalog):  # type: ignore
         async with self._client_lock:
             try:
                 loop = asyncio.get_running_loop()
-                result: str = await loop.run_in_executor(None, super().record, data)
+                result: str = await loop.run_in_executor(_DATALOG_EXECUTOR, super().record, data)
                 return result
             except Exception as e:
                 raise RobonomicsError(str(e)) from e
 
 
 ROBONOMICS_ACCOUNT: Account | None = None
+DATALOG_CLIENT: AsyncDatalogClient | None = None
 
 if CONFIG.robonomics.enable_datalog:
     ROBONOMICS_ACCOUNT = Account(
         seed=CONFIG.robonomics.account_seed,
         remote_ws=CONFIG.robonomics.substrate_node_uri,
     )
+    DATALOG_CLIENT = AsyncDatalogClient(
+        account=ROBONOMICS_ACCOUNT,
+        wait_for_inclusion=False,
+    )
+
+
+# most recent records posted during this run, so retried passport uploads don't pay for a duplicate transaction
+POSTED_RECORDS_MAXSIZE: int = 512
+_posted_records: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+
+def get_posted_txn_hash(content: str, unit_internal_id: str) -> str | None:
+    """get the transaction hash of the data recently posted to the datalog during this run, if any"""
+    return _posted_records.get((content, unit_internal_id))
+
+
+def _remember_posted_record(content: str, unit_internal_id: str, txn_hash: str) -> None:
+    """save the transaction hash of the posted data, evicting the oldest records beyond the limit"""
+    _remember_posted_record(content, unit_internal_id, txn_hash)
+    _posted_records.move_to_end((content, unit_internal_id))
+    while len(_posted_records) > POSTED_RECORDS_MAXSIZE:
+        _posted_records.popitem(last=False)
 
 
 @async_time_execution
 async def post_to_datalog(content: str, unit_internal_id: str) -> None:
-    assert ROBONOMICS_ACCOUNT is not None, "Robonomics credentials have not been provided"
-    datalog_client = AsyncDatalogClient(
-        account=ROBONOMICS_ACCOUNT,
-        wait_for_inclusion=False,
-    )
+    assert DATALOG_CLIENT is not None, "Robonomics credentials have not been provided"
+
+    if (posted_txn_hash := get_posted_txn_hash(content, unit_internal_id)) is not None:
+        logger.info(f"Data '{content}' has already been posted to the Robonomics datalog. {posted_txn_hash=}")
+        await MongoDbWrapper().unit_update_single_field(unit_internal_id, "txn_hash", posted_txn_hash)
+        return
+
     logger.info(f"Posting data '{content}' to Robonomics datalog")
     retry_cnt = 3
     txn_hash: str = ""
 
     for i in range(1, retry_cnt + 1):
         try:
-            txn_hash = await datalog_client.record(data=content)
+            txn_hash = await DATALOG_CLIENT.record(data=content)
             break
         except Exception as e:
             logger.error(f"Failed to post to the Datalog (attempt {i}/{retry_cnt}): {e}")
@@ -59,7 +94,72 @@ async def post_to_datalog(content: str, unit_internal_id: str) -> None:
 
     assert txn_hash
     await MongoDbWrapper().unit_update_single_field(unit_internal_id, "txn_hash", txn_hash)
+    _remember_posted_record(content, unit_internal_id, txn_hash)
     message = f"Data '{content}' has been posted to the Robonomics datalog. {txn_hash=}"
     messenger.success(translation('DataPublished'))
     logger.info(message)
 
+
+class DatalogPublisher(metaclass=SingletonMeta):
+    """
+    A single long-lived worker posting queued records to the Robonomics datalog.
+
+    Records are posted one at a time (the datalog client serializes them anyway),
+    and a bounded queue makes producers wait if posting falls behind.
+
+    Singleton object.
+    """
+
+    def __init__(self, queue_size: int = 16, shutdown_timeout: float = DATALOG_SHUTDOWN_TIMEOUT_SEC) -> None:
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=queue_size)
+        self._worker: asyncio.Task[None] | None = None
+        self._current_record: tuple[str, str] | None = None
+        self._shutdown_timeout: float = shutdown_timeout
+
+    async def _run(self) -> None:
+        while True:
+            self._current_record = await self._queue.get()
+            content, unit_internal_id = self._current_record
+            try:
+                await post_to_datalog(content, unit_internal_id)
+            except Exception as e:
+                logger.error(f"Failed to post data for unit {unit_internal_id} to the Robonomics datalog: {e}")
+            finally:
+                self._current_record = None
+                self._queue.task_done()
+
+    async def enqueue(self, content: str, unit_internal_id: str) -> None:
+        """Queue data to be posted to the datalog, starting the worker if needed"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        await self._queue.put((content, unit_internal_id))
+
+    def _drop_pending_records(self) -> None:
+        """Discard the records which haven't been posted, logging each of them"""
+        dropped = [self._current_record] if self._current_record is not None else []
+
+        while not self._queue.empty():
+            dropped.append(self._queue.get_nowait())
+            self._queue.task_done()
+
+        for content, unit_internal_id in dropped:
+            logger.warning(f"Data '{content}' for unit {unit_internal_id} has not been posted to the Robonomics datalog")
+
+    async def shutdown(self) -> None:
+        """Wait for the queued data to be posted (for a limited time) and stop the worker"""
+        if self._worker is None:
+            return
+
+        if pending := self._queue.qsize():
+            logger.info(f"Waiting for {pending} queued datalog records to be posted")
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self._shutdown_timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Datalog records were not posted within {self._shutdown_timeout}s, dropping them")
+            self._drop_pending_records()
+
+        self._worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+        self._worker = None
@@ -0,0 +1,33 @@
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from feecc_workbench import _ipfs_cache
+from feecc_workbench._ipfs_cache import cache_publication, get_cached_publication
+
+DIGEST = hashlib.sha256(b"passport").hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cache_dir = tmp_path / "ipfs_cache"
+    monkeypatch.setattr(_ipfs_cache, "CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def test_missing_publication() -> None:
+    assert get_cached_publication(DIGEST) is None
+
+
+def test_publication_round_trip(cache_dir: Path) -> None:
+    cache_publication(DIGEST, "QmTestCid", "https://gateway.ipfs.io/ipfs/QmTestCid")
+    assert get_cached_publication(DIGEST) == ("QmTestCid", "https://gateway.ipfs.io/ipfs/QmTestCid")
+    assert (cache_dir / DIGEST[:2] / f"{DIGEST[2:]}.json").is_file()
+
+
+def test_corrupt_record(cache_dir: Path) -> None:
+    record_path = cache_dir / DIGEST[:2] / f"{DIGEST[2:]}.json"
+    record_path.parent.mkdir(parents=True)
+    record_path.write_text("{not json")
+    assert get_cached_publication(DIGEST) is None
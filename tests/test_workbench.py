@@ -0,0 +1,59 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from feecc_workbench import WorkBench as workbench_module
+from feecc_workbench.WorkBench import WorkBench
+
+RECORD_FILENAME = "output/video/test_record.mp4"
+
+
+async def _end_record() -> None:
+    """camera.end_record stub, the record is always stopped successfully"""
+
+
+def get_workbench(ipfs_enabled: bool) -> WorkBench:
+    """get a workbench with a stopped record, bypassing the singleton and the database connection"""
+    workbench: WorkBench = object.__new__(WorkBench)
+    workbench.camera = SimpleNamespace(end_record=_end_record, record=SimpleNamespace(filename=RECORD_FILENAME))
+    workbench.employee = SimpleNamespace(rfid_card_id="1111111111")
+    workbench._ipfs_enabled = ipfs_enabled
+    return workbench
+
+
+def test_end_record_ipfs_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Path] = []
+
+    async def publish_file(rfid_card_id: str, file_path: Path) -> tuple[str, str]:
+        calls.append(file_path)
+        return "QmTestCid", "https://gateway.ipfs.io/ipfs/QmTestCid"
+
+    monkeypatch.setattr(workbench_module, "publish_file", publish_file)
+    ipfs_hashes, _ = asyncio.run(get_workbench(ipfs_enabled=False)._end_record())
+
+    assert ipfs_hashes == []
+    assert not calls
+
+
+def test_end_record_publish_failed(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def publish_file(**_: Any) -> tuple[str, str]:
+        raise ConnectionError("IPFS gateway is not available")
+
+    monkeypatch.setattr(workbench_module, "publish_file", publish_file)
+    ipfs_hashes, _ = asyncio.run(get_workbench(ipfs_enabled=True)._end_record())
+
+    assert ipfs_hashes == []
+
+
+def test_end_record_published(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def publish_file(rfid_card_id: str, file_path: Path) -> tuple[str, str]:
+        assert file_path == Path(RECORD_FILENAME)
+        return "QmTestCid", "https://gateway.ipfs.io/ipfs/QmTestCid"
+
+    monkeypatch.setattr(workbench_module, "publish_file", publish_file)
+    ipfs_hashes, _ = asyncio.run(get_workbench(ipfs_enabled=True)._end_record())
+
+    assert ipfs_hashes == ["QmTestCid"]